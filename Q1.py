@@ -5,6 +5,10 @@ Author: [Your Name Here]
 Partner: [Partner Name if applicable]
 """
 
+from report import (resolve_target, write_report, write_rows,
+                    write_text, write_truncation_note)
+
+
 class Band:
     """Data structure to store band performance information"""
     def __init__(self, name, start, end):
@@ -77,20 +81,42 @@ def get_user_input():
         return []
 
 
-def print_results(bands, selected):
-    """Display scheduling results"""
-    print("\n" + "="*60)
-    print("MUSIC FESTIVAL SCHEDULING RESULTS")
-    print("="*60)
-    
-    print(f"\nTotal bands proposed: {len(bands)}")
-    print(f"Maximum bands that can perform: {len(selected)}")
-    
-    print("\nSelected bands schedule:")
-    for i, band in enumerate(selected, 1):
-        print(f"  {i}. {band.name}: {band.start}:00 - {band.end}:00")
-    
-    print("\n" + "="*60)
+BAND_COLUMNS = (("slot", "q"), ("name", "s"), ("start", "d"), ("end", "d"))
+
+
+def print_results(bands, selected, out=None, fmt="table", limit=None, summary_only=False):
+    """
+    Display scheduling results
+
+    Args:
+        bands: List of proposed Band objects
+        selected: List of selected Band objects
+        out: File-like target (defaults to standard output)
+        fmt: "table", "csv", "jsonl" or "binary" (see report.py)
+        limit: Show at most this many selected bands
+        summary_only: Only show the totals, not the schedule
+    """
+    rows = ((i, band.name, band.start, band.end) for i, band in enumerate(selected, 1))
+    if fmt != "table":
+        summary = [("bands_proposed", len(bands)), ("bands_selected", len(selected))]
+        write_report(out, rows, BAND_COLUMNS, fmt, summary, limit, summary_only)
+        return
+    
+    out = resolve_target(out, fmt, limit)
+    write_text(out,
+               "\n" + "="*60,
+               "MUSIC FESTIVAL SCHEDULING RESULTS",
+               "="*60,
+               f"\nTotal bands proposed: {len(bands)}",
+               f"Maximum bands that can perform: {len(selected)}")
+    
+    if not summary_only:
+        write_text(out, "\nSelected bands schedule:")
+        _, skipped = write_rows(out, rows, BAND_COLUMNS, fmt,
+                                "  {0}. {1}: {2}:00 - {3}:00", limit)
+        write_truncation_note(out, skipped)
+    
+    write_text(out, "\n" + "="*60)
 
 
 # ============== TEST CASES ==============
@@ -3,6 +3,10 @@ Question 2: Minimizing Freight Truck Travel Cost in a Warehouse Network
 Using Kruskal's Algorithm (Greedy MST Algorithm)
 """
 
+from report import (resolve_target, write_report, write_rows,
+                    write_text, write_truncation_note)
+
+
 class UnionFind:
     """
     Union-Find (Disjoint Set Union) data structure for efficient cycle detection
@@ -83,35 +87,76 @@ def kruskal_mst(num_warehouses, edges):
     return mst_edges, total_cost
 
 
-def print_graph(num_warehouses, edges):
-    """Helper function to display the graph"""
-    print("\n" + "="*60)
-    print("WAREHOUSE NETWORK GRAPH")
-    print("="*60)
-    print(f"Number of Warehouses: {num_warehouses}")
-    print(f"Number of Potential Routes: {len(edges)}")
-    print("\nAll Potential Transportation Lines:")
-    print(f"{'From':<10} {'To':<10} {'Cost':<10}")
-    print("-" * 30)
-    for w1, w2, cost in edges:
-        print(f"{w1:<10} {w2:<10} ${cost:<10}")
-
-
-def print_mst_result(mst_edges, total_cost):
-    """Helper function to display MST results"""
-    print("\n" + "="*60)
-    print("MINIMUM SPANNING TREE SOLUTION")
-    print("="*60)
-    print(f"\nSelected Transportation Lines (Minimum Cost Network):")
-    print(f"{'From':<10} {'To':<10} {'Cost':<10}")
-    print("-" * 30)
-    for w1, w2, cost in mst_edges:
-        print(f"{w1:<10} {w2:<10} ${cost:<10}")
-    
-    print(f"\n{'='*30}")
-    print(f"TOTAL MINIMUM COST: ${total_cost}")
-    print(f"{'='*30}")
-    print(f"Number of routes built: {len(mst_edges)}")
+EDGE_COLUMNS = (("from", "q"), ("to", "q"), ("cost", "d"))
+EDGE_ROW_FORMAT = "{0:<10} {1:<10} ${2:<10}"
+
+
+def print_graph(num_warehouses, edges, out=None, fmt="table", limit=None, summary_only=False):
+    """
+    Helper function to display the graph
+    
+    Parameters:
+    - out: file-like target (defaults to standard output)
+    - fmt: "table", "csv", "jsonl" or "binary" (see report.py)
+    - limit: show at most this many edges
+    - summary_only: only show the counts, not the edge list
+    """
+    if fmt != "table":
+        summary = [("warehouses", num_warehouses), ("routes", len(edges))]
+        write_report(out, edges, EDGE_COLUMNS, fmt, summary, limit, summary_only)
+        return
+    
+    out = resolve_target(out, fmt, limit)
+    write_text(out,
+               "\n" + "="*60,
+               "WAREHOUSE NETWORK GRAPH",
+               "="*60,
+               f"Number of Warehouses: {num_warehouses}",
+               f"Number of Potential Routes: {len(edges)}")
+    if summary_only:
+        return
+    
+    write_text(out,
+               "\nAll Potential Transportation Lines:",
+               f"{'From':<10} {'To':<10} {'Cost':<10}",
+               "-" * 30)
+    _, skipped = write_rows(out, edges, EDGE_COLUMNS, fmt, EDGE_ROW_FORMAT, limit)
+    write_truncation_note(out, skipped)
+
+
+def print_mst_result(mst_edges, total_cost, out=None, fmt="table", limit=None, summary_only=False):
+    """
+    Helper function to display MST results
+    
+    Parameters:
+    - out: file-like target (defaults to standard output)
+    - fmt: "table", "csv", "jsonl" or "binary" (see report.py)
+    - limit: show at most this many MST edges
+    - summary_only: only show the total cost and route count
+    """
+    if fmt != "table":
+        summary = [("total_cost", total_cost), ("routes_built", len(mst_edges))]
+        write_report(out, mst_edges, EDGE_COLUMNS, fmt, summary, limit, summary_only)
+        return
+    
+    out = resolve_target(out, fmt, limit)
+    write_text(out,
+               "\n" + "="*60,
+               "MINIMUM SPANNING TREE SOLUTION",
+               "="*60)
+    if not summary_only:
+        write_text(out,
+                   f"\nSelected Transportation Lines (Minimum Cost Network):",
+                   f"{'From':<10} {'To':<10} {'Cost':<10}",
+                   "-" * 30)
+        _, skipped = write_rows(out, mst_edges, EDGE_COLUMNS, fmt, EDGE_ROW_FORMAT, limit)
+        write_truncation_note(out, skipped)
+    
+    write_text(out,
+               f"\n{'='*30}",
+               f"TOTAL MINIMUM COST: ${total_cost}",
+               f"{'='*30}",
+               f"Number of routes built: {len(mst_edges)}")
 
 
 # ============================================================================
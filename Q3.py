@@ -3,6 +3,10 @@ Question 3: Conference Room Allocation with Sponsors
 Scheduling seminars across two conference rooms to maximize total profit
 """
 
+from report import (resolve_target, write_report, write_rows,
+                    write_text, write_truncation_note)
+
+
 def greedy_two_room_scheduling(seminars):
     """
     GREEDY STRATEGY (HEURISTIC - NOT ALWAYS OPTIMAL):
@@ -122,42 +126,91 @@ def earliest_end_time_greedy(seminars):
     return scheduled, total_profit, room1_schedule, room2_schedule
 
 
-def print_seminars(seminars):
-    """Display all available seminars"""
-    print("\n" + "="*70)
-    print("ALL AVAILABLE SEMINARS")
-    print("="*70)
-    print(f"{'ID':<6} {'Start':<8} {'End':<8} {'Profit':<10} {'Duration':<10}")
-    print("-" * 70)
-    for start, end, profit, sem_id in seminars:
-        duration = end - start
-        print(f"S{sem_id:<5} {start:<8} {end:<8} ${profit:<9} {duration} hours")
+SEMINAR_COLUMNS = (("id", "q"), ("start", "d"), ("end", "d"), ("profit", "d"), ("duration", "d"))
+SCHEDULE_COLUMNS = (("id", "q"), ("start", "d"), ("end", "d"), ("profit", "d"), ("room", "s"))
+
+
+def print_seminars(seminars, out=None, fmt="table", limit=None, summary_only=False):
+    """
+    Display all available seminars
     
+    Parameters:
+    - out: file-like target (defaults to standard output)
+    - fmt: "table", "csv", "jsonl" or "binary" (see report.py)
+    - limit: show at most this many seminars
+    - summary_only: only show the totals, not the seminar list
+    """
+    rows = ((sem_id, start, end, profit, end - start)
+            for start, end, profit, sem_id in seminars)
     total_possible = sum(s[2] for s in seminars)
-    print(f"\nTotal available seminars: {len(seminars)}")
-    print(f"Total possible profit (if all could run): ${total_possible}")
+    if fmt != "table":
+        summary = [("seminars", len(seminars)), ("total_possible_profit", total_possible)]
+        write_report(out, rows, SEMINAR_COLUMNS, fmt, summary, limit, summary_only)
+        return
+    
+    out = resolve_target(out, fmt, limit)
+    write_text(out,
+               "\n" + "="*70,
+               "ALL AVAILABLE SEMINARS",
+               "="*70)
+    if not summary_only:
+        write_text(out,
+                   f"{'ID':<6} {'Start':<8} {'End':<8} {'Profit':<10} {'Duration':<10}",
+                   "-" * 70)
+        _, skipped = write_rows(out, rows, SEMINAR_COLUMNS, fmt,
+                                "S{0:<5} {1:<8} {2:<8} ${3:<9} {4} hours", limit)
+        write_truncation_note(out, skipped)
+    
+    write_text(out,
+               f"\nTotal available seminars: {len(seminars)}",
+               f"Total possible profit (if all could run): ${total_possible}")
 
 
-def print_schedule_result(scheduled, total_profit, room1_schedule, room2_schedule, title):
-    """Display scheduling results"""
-    print("\n" + "="*70)
-    print(f"{title}")
-    print("="*70)
-    
-    # Sort by start time for display
-    scheduled_sorted = sorted(scheduled, key=lambda x: x[0])
-    
-    print(f"\n{'ID':<6} {'Start':<8} {'End':<8} {'Profit':<10} {'Room':<10}")
-    print("-" * 70)
-    for start, end, profit, sem_id, room in scheduled_sorted:
-        print(f"S{sem_id:<5} {start:<8} {end:<8} ${profit:<9} {room}")
+def print_schedule_result(scheduled, total_profit, room1_schedule, room2_schedule, title,
+                          out=None, fmt="table", limit=None, summary_only=False):
+    """
+    Display scheduling results
     
-    print(f"\n{'='*35}")
-    print(f"TOTAL PROFIT: ${total_profit}")
-    print(f"{'='*35}")
-    print(f"Seminars scheduled: {len(scheduled)}")
-    print(f"Room 1: {len(room1_schedule)} seminars")
-    print(f"Room 2: {len(room2_schedule)} seminars")
+    Parameters:
+    - out: file-like target (defaults to standard output)
+    - fmt: "table", "csv", "jsonl" or "binary" (see report.py)
+    - limit: show at most this many scheduled seminars
+    - summary_only: only show the totals, not the schedule
+    """
+    # Sort by start time so every format reports the same rows in the same order
+    scheduled_sorted = [] if summary_only else sorted(scheduled, key=lambda x: x[0])
+    rows = ((sem_id, start, end, profit, room)
+            for start, end, profit, sem_id, room in scheduled_sorted)
+    
+    if fmt != "table":
+        summary = [("title", title), ("total_profit", total_profit),
+                   ("seminars_scheduled", len(scheduled)),
+                   ("room1_seminars", len(room1_schedule)),
+                   ("room2_seminars", len(room2_schedule))]
+        write_report(out, rows, SCHEDULE_COLUMNS, fmt, summary, limit, summary_only)
+        return
+    
+    out = resolve_target(out, fmt, limit)
+    write_text(out,
+               "\n" + "="*70,
+               f"{title}",
+               "="*70)
+    
+    if not summary_only:
+        write_text(out,
+                   f"\n{'ID':<6} {'Start':<8} {'End':<8} {'Profit':<10} {'Room':<10}",
+                   "-" * 70)
+        _, skipped = write_rows(out, rows, SCHEDULE_COLUMNS, fmt,
+                                "S{0:<5} {1:<8} {2:<8} ${3:<9} {4}", limit)
+        write_truncation_note(out, skipped)
+    
+    write_text(out,
+               f"\n{'='*35}",
+               f"TOTAL PROFIT: ${total_profit}",
+               f"{'='*35}",
+               f"Seminars scheduled: {len(scheduled)}",
+               f"Room 1: {len(room1_schedule)} seminars",
+               f"Room 2: {len(room2_schedule)} seminars")
 
 
 def demonstrate_greedy_failure():
@@ -0,0 +1,363 @@
+"""
+Shared reporting helpers for the greedy algorithm results
+Writes result rows to any file-like target in one buffered pass instead of
+calling print() once per row
+"""
+
+import csv
+import io
+import json
+import struct
+import sys
+from itertools import islice
+
+# Supported output formats
+FORMATS = ("table", "csv", "jsonl", "binary")
+
+# Number of rows formatted and written per write() call
+CHUNK_SIZE = 8192
+
+# Binary format: magic bytes followed by a version number
+BINARY_MAGIC = b"GRPT"
+BINARY_VERSION = 1
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_TRAILER = struct.Struct("<qq")
+
+# Column type codes (see COMPACT BINARY FORMAT)
+_NUMERIC_CODES = ("q", "d")
+
+
+def check_limit(limit):
+    """Reject row limits that are not None or a non-negative integer"""
+    if limit is None:
+        return
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+        raise ValueError(f"Row limit must be None or a non-negative integer, got {limit!r}")
+
+
+def resolve_target(out, fmt, limit=None):
+    """
+    Check the report options and return the stream to write to,
+    defaulting to standard output
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown report format: {fmt!r} (expected one of {FORMATS})")
+    check_limit(limit)
+    binary = fmt == "binary"
+    if out is None:
+        if not binary:
+            return sys.stdout
+        # stdout may have been replaced by a text-only stream (e.g. StringIO)
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            raise ValueError("Binary reports need a binary stream: standard output "
+                             "has no binary buffer, pass one as out")
+        # Keep already-printed text ahead of the raw bytes
+        sys.stdout.flush()
+        return buffer
+    if binary and isinstance(out, io.TextIOBase):
+        raise ValueError("Binary reports need a binary stream, got a text stream")
+    if not binary and isinstance(out, (io.RawIOBase, io.BufferedIOBase)):
+        raise ValueError(f"{fmt!r} reports need a text stream, got a binary stream")
+    return out
+
+
+def write_text(out, *lines):
+    """Write several lines of text with a single write() call"""
+    out.write("\n".join(lines) + "\n")
+
+
+def _chunks(rows, size):
+    """Yield lists of at most `size` rows from any iterable"""
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_rows(out, rows, columns, fmt="table", row_format=None, limit=None):
+    """
+    Stream rows to `out` in chunks of CHUNK_SIZE rows
+
+    Parameters:
+    - out: text stream (binary stream for fmt="binary")
+    - rows: iterable of tuples, consumed lazily
+    - columns: sequence of (name, type_code) pairs describing each row
+    - fmt: "table", "csv", "jsonl" or "binary"
+    - row_format: str.format template for one table row, e.g. "{0:<10} {1}"
+    - limit: write at most this many rows (None writes everything)
+
+    Returns:
+    - (written, skipped): rows written and rows dropped by `limit`
+    """
+    check_limit(limit)
+    if fmt == "table" and row_format is None:
+        raise ValueError("Table output needs a row_format template")
+
+    it = iter(rows)
+    selected = it if limit is None else islice(it, limit)
+    names = [name for name, _ in columns]
+    written = 0
+
+    if fmt == "table":
+        render = row_format.format
+        for chunk in _chunks(selected, CHUNK_SIZE):
+            out.write("\n".join([render(*row) for row in chunk]) + "\n")
+            written += len(chunk)
+    elif fmt == "csv":
+        writer = csv.writer(out, lineterminator="\n")
+        for chunk in _chunks(selected, CHUNK_SIZE):
+            writer.writerows(chunk)
+            written += len(chunk)
+    elif fmt == "jsonl":
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+        for chunk in _chunks(selected, CHUNK_SIZE):
+            out.write("\n".join([dumps(dict(zip(names, row))) for row in chunk]) + "\n")
+            written += len(chunk)
+    elif fmt == "binary":
+        # Each chunk is framed by its row count (see COMPACT BINARY FORMAT)
+        pack_row = _binary_row_packer(columns)
+        for chunk in _chunks(selected, CHUNK_SIZE):
+            out.write(_U32.pack(len(chunk)) + b"".join([pack_row(row) for row in chunk]))
+            written += len(chunk)
+    else:
+        raise ValueError(f"Unknown report format: {fmt!r} (expected one of {FORMATS})")
+
+    # Count (without formatting) whatever the limit cut off
+    skipped = 0 if limit is None else sum(1 for _ in it)
+    return written, skipped
+
+
+def write_truncation_note(out, skipped):
+    """Table-format marker for rows dropped by a row limit"""
+    if skipped:
+        write_text(out, f"  ... {skipped} more rows not shown")
+
+
+def write_report(out, rows, columns, fmt, summary=(), limit=None, summary_only=False):
+    """
+    Write a machine-readable report (csv, jsonl or binary)
+
+    Parameters:
+    - out: target stream, or None for standard output
+    - rows: iterable of tuples matching `columns`
+    - columns: sequence of (name, type_code) pairs
+    - fmt: "csv", "jsonl" or "binary"
+    - summary: sequence of (label, value) pairs describing the result
+      (int, float or str values)
+    - limit: write at most this many rows
+    - summary_only: write the summary and no rows
+
+    CSV writes a header row and the data rows, an empty line, then a
+    field/value block holding the summary plus rows_written/rows_skipped
+    (see read_csv_report). With summary_only it writes just the
+    field/value block. JSON-lines writes the summary as the first object
+    under a "summary" key, then one object per row.
+
+    Rows dropped by `limit` are reported after the rows, since the header
+    is written before the row count is known: the rows_written/rows_skipped
+    fields for CSV, a final {"truncated": {...}} object for JSON-lines,
+    and the end-of-rows trailer for binary.
+    """
+    out = resolve_target(out, fmt, limit)
+
+    if fmt == "csv":
+        writer = csv.writer(out, lineterminator="\n")
+        if summary_only:
+            _write_csv_summary(writer, summary)
+            return
+        writer.writerow([name for name, _ in columns])
+    elif fmt == "jsonl":
+        out.write(json.dumps({"summary": dict(summary)}, separators=(",", ":")) + "\n")
+        if summary_only:
+            return
+    elif fmt == "binary":
+        out.write(_binary_header(summary, columns))
+        if summary_only:
+            out.write(_binary_trailer(0, 0))
+            return
+    else:
+        raise ValueError(f"write_report() handles csv, jsonl and binary, not {fmt!r}")
+
+    written, skipped = write_rows(out, rows, columns, fmt, limit=limit)
+
+    if fmt == "binary":
+        out.write(_binary_trailer(written, skipped))
+    elif fmt == "csv":
+        writer.writerow(())
+        _write_csv_summary(writer, [*summary, ("rows_written", written), ("rows_skipped", skipped)])
+    elif skipped:
+        truncated = {"rows_written": written, "rows_skipped": skipped}
+        out.write(json.dumps({"truncated": truncated}, separators=(",", ":")) + "\n")
+
+
+def _write_csv_summary(writer, summary):
+    writer.writerow(("field", "value"))
+    writer.writerows(summary)
+
+
+def read_csv_report(stream):
+    """
+    Read a report written with fmt="csv"
+
+    Returns:
+    - summary: list of (field, value) pairs, values as strings
+    - header: list of column names ([] for a summary_only report)
+    - rows: list of data rows, values as strings
+    """
+    lines = list(csv.reader(stream))
+    if [] in lines:
+        split = lines.index([])
+        table, block = lines[:split], lines[split + 1:]
+    else:
+        table, block = [], lines
+    header, rows = (table[0], table[1:]) if table else ([], [])
+    summary = [(field, value) for field, value in block[1:]]
+    return summary, header, rows
+
+
+# ============== COMPACT BINARY FORMAT ==============
+#
+# Layout (little-endian):
+#   magic "GRPT", u8 version
+#   u16 summary count, then per entry: string label, u8 type code, value
+#   u16 column count, then per column: string name, u8 type code
+#   row chunks: u32 row count, then each value packed by its column type
+#   end of rows: u32 0, then i64 rows written, i64 rows skipped by a limit
+# Strings are a u32 byte length followed by UTF-8 bytes.
+#
+# Type codes: 'q' = i64, 'd' = f64, 's' = string. Use 'q' only for values
+# that are always integers (ids, indices, counts); costs, profits and
+# times may be any number, so declare them 'd' or float input will fail
+# to pack.
+
+def _pack_str(value):
+    data = str(value).encode("utf-8")
+    return _U32.pack(len(data)) + data
+
+
+def _summary_code(value):
+    """Pick the binary type code for a summary value"""
+    if isinstance(value, str):
+        return "s"
+    if isinstance(value, float):
+        return "d"
+    return "q"
+
+
+def _binary_header(summary, columns):
+    parts = [BINARY_MAGIC, _U8.pack(BINARY_VERSION), _U16.pack(len(summary))]
+    for label, value in summary:
+        code = _summary_code(value)
+        parts.append(_pack_str(label))
+        parts.append(code.encode("ascii"))
+        parts.append(_pack_str(value) if code == "s" else struct.pack("<" + code, value))
+    parts.append(_U16.pack(len(columns)))
+    for name, code in columns:
+        parts.append(_pack_str(name))
+        parts.append(code.encode("ascii"))
+    return b"".join(parts)
+
+
+def _binary_trailer(written, skipped):
+    return _U32.pack(0) + _TRAILER.pack(written, skipped)
+
+
+def _binary_row_packer(columns):
+    """Build a function that packs one row according to the column types"""
+    codes = [code for _, code in columns]
+    for code in codes:
+        if code not in _NUMERIC_CODES and code != "s":
+            raise ValueError(f"Unknown column type code: {code!r}")
+
+    # All-numeric rows pack with one precompiled struct
+    if "s" not in codes:
+        row_struct = struct.Struct("<" + "".join(codes))
+        return lambda row: row_struct.pack(*row)
+
+    packers = [_pack_str if code == "s" else struct.Struct("<" + code).pack for code in codes]
+    return lambda row: b"".join([pack(value) for pack, value in zip(packers, row)])
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated binary report")
+    return data
+
+
+def _read_str(stream):
+    (length,) = _U32.unpack(_read_exact(stream, _U32.size))
+    return _read_exact(stream, length).decode("utf-8")
+
+
+class BinaryReport:
+    """
+    A report read back from fmt="binary"
+
+    Rows are read lazily by iterating over the report. rows_written and
+    rows_skipped are filled in from the trailer once iteration finishes.
+    """
+    def __init__(self, stream, summary, columns):
+        self.stream = stream
+        self.summary = summary
+        self.columns = columns
+        self.rows_written = None
+        self.rows_skipped = None
+
+    def __iter__(self):
+        stream = self.stream
+        unpackers = [None if code == "s" else struct.Struct("<" + code)
+                     for _, code in self.columns]
+        while True:
+            (count,) = _U32.unpack(_read_exact(stream, _U32.size))
+            if count == 0:
+                self.rows_written, self.rows_skipped = _TRAILER.unpack(
+                    _read_exact(stream, _TRAILER.size))
+                return
+            for _ in range(count):
+                row = []
+                for unpacker in unpackers:
+                    if unpacker is None:
+                        row.append(_read_str(stream))
+                    else:
+                        row.append(unpacker.unpack(_read_exact(stream, unpacker.size))[0])
+                yield tuple(row)
+
+
+def read_binary(stream):
+    """
+    Read a report written with fmt="binary"
+
+    Returns:
+    - BinaryReport with the summary and columns; iterate over it for the rows
+    """
+    if _read_exact(stream, len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError("Not a binary report")
+    (version,) = _U8.unpack(_read_exact(stream, _U8.size))
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary report version: {version}")
+
+    (summary_count,) = _U16.unpack(_read_exact(stream, _U16.size))
+    summary = []
+    for _ in range(summary_count):
+        label = _read_str(stream)
+        code = _read_exact(stream, 1).decode("ascii")
+        if code == "s":
+            value = _read_str(stream)
+        else:
+            (value,) = struct.unpack("<" + code, _read_exact(stream, struct.calcsize("<" + code)))
+        summary.append((label, value))
+
+    (column_count,) = _U16.unpack(_read_exact(stream, _U16.size))
+    columns = []
+    for _ in range(column_count):
+        name = _read_str(stream)
+        columns.append((name, _read_exact(stream, 1).decode("ascii")))
+
+    return BinaryReport(stream, summary, columns)
@@ -0,0 +1,216 @@
+"""
+Tests for the shared report writers (report.py) and the print_* helpers
+that use them. Run with: python -m pytest -q
+"""
+
+import io
+import json
+from contextlib import redirect_stdout
+
+import pytest
+
+import report
+
+# Q2 and Q3 run their demo test cases on import
+with redirect_stdout(io.StringIO()):
+    import Q1
+    import Q2
+    import Q3
+
+
+EDGES = [(0, 1, 10), (0, 2, 6), (1, 2, 2.5), (1, 3, 15), (2, 3, 4)]
+
+
+def binary_report(write, **kwargs):
+    """Write a binary report with `write` and read it back"""
+    buf = io.BytesIO()
+    write(out=buf, fmt="binary", **kwargs)
+    buf.seek(0)
+    result = report.read_binary(buf)
+    return result, list(result)
+
+
+def text_report(write, fmt, **kwargs):
+    out = io.StringIO()
+    write(out=out, fmt=fmt, **kwargs)
+    return out.getvalue()
+
+
+def schedule_writer():
+    scheduled, profit, room1, room2 = Q3.greedy_two_room_scheduling(Q3.seminars_1)
+    return lambda **kwargs: Q3.print_schedule_result(
+        scheduled, profit, room1, room2, "GREEDY", **kwargs)
+
+
+# ============== BINARY ROUND TRIP ==============
+
+def test_binary_round_trip_with_float_costs():
+    mst_edges, total_cost = Q2.kruskal_mst(4, EDGES)
+    result, rows = binary_report(lambda **kw: Q2.print_mst_result(mst_edges, total_cost, **kw))
+
+    assert rows == [tuple(edge) for edge in mst_edges]
+    assert result.summary == [("total_cost", total_cost), ("routes_built", 3)]
+    assert result.columns == list(Q2.EDGE_COLUMNS)
+    assert (result.rows_written, result.rows_skipped) == (3, 0)
+
+
+def test_binary_round_trip_with_string_columns():
+    bands = [Q1.Band("Rock", 9, 11), Q1.Band("Jazz", 11, 12.5)]
+    _, rows = binary_report(lambda **kw: Q1.print_results(bands, bands, **kw))
+    assert rows == [(1, "Rock", 9, 11), (2, "Jazz", 11, 12.5)]
+
+    result, rows = binary_report(schedule_writer())
+    assert [row[4] for row in rows] == ["Room 1", "Room 2", "Room 2", "Room 1",
+                                        "Room 2", "Room 1", "Room 2", "Room 1"]
+    assert ("title", "GREEDY") in result.summary
+
+
+def test_binary_summary_keeps_value_types():
+    result, _ = binary_report(lambda **kw: Q2.print_graph(4, EDGES, **kw))
+    assert result.summary == [("warehouses", 4), ("routes", 5)]
+    assert all(isinstance(value, int) for _, value in result.summary)
+
+    big = 2**60 + 1
+    buf = io.BytesIO()
+    report.write_report(buf, [], Q2.EDGE_COLUMNS, "binary", [("big", big), ("ratio", 0.5)])
+    buf.seek(0)
+    assert report.read_binary(buf).summary == [("big", big), ("ratio", 0.5)]
+
+
+def test_binary_spans_several_chunks(monkeypatch):
+    monkeypatch.setattr(report, "CHUNK_SIZE", 2)
+    edges = [(i, i + 1, i * 1.5) for i in range(7)]
+    result, rows = binary_report(lambda **kw: Q2.print_graph(8, edges, **kw))
+    assert rows == edges
+    assert result.rows_written == 7
+
+
+def test_binary_without_trailer_is_rejected():
+    buf = io.BytesIO()
+    Q2.print_graph(4, EDGES, out=buf, fmt="binary")
+    with pytest.raises(ValueError):
+        list(report.read_binary(io.BytesIO(buf.getvalue()[:-4])))
+
+
+# ============== LIMIT ==============
+
+def test_limit_table():
+    output = text_report(lambda **kw: Q2.print_graph(4, EDGES, **kw), "table", limit=2)
+    assert "  ... 3 more rows not shown" in output
+    assert "$15" not in output
+
+
+def test_limit_csv():
+    output = text_report(lambda **kw: Q2.print_graph(4, EDGES, **kw), "csv", limit=2)
+    summary, header, rows = report.read_csv_report(io.StringIO(output))
+    assert header == ["from", "to", "cost"]
+    assert rows == [["0", "1", "10"], ["0", "2", "6"]]
+    assert ("rows_written", "2") in summary and ("rows_skipped", "3") in summary
+
+
+def test_limit_jsonl():
+    output = text_report(lambda **kw: Q2.print_graph(4, EDGES, **kw), "jsonl", limit=2)
+    records = [json.loads(line) for line in output.splitlines()]
+    assert records[0] == {"summary": {"warehouses": 4, "routes": 5}}
+    assert records[1:3] == [{"from": 0, "to": 1, "cost": 10}, {"from": 0, "to": 2, "cost": 6}]
+    assert records[3] == {"truncated": {"rows_written": 2, "rows_skipped": 3}}
+
+
+def test_limit_binary():
+    result, rows = binary_report(lambda **kw: Q2.print_graph(4, EDGES, **kw), limit=2)
+    assert rows == EDGES[:2]
+    assert (result.rows_written, result.rows_skipped) == (2, 3)
+
+
+def test_limit_not_reached_has_no_marker():
+    for fmt in ("table", "csv", "jsonl"):
+        output = text_report(lambda **kw: Q2.print_graph(4, EDGES, **kw), fmt, limit=10)
+        assert "truncated" not in output and "more rows" not in output
+
+
+# ============== SUMMARY ONLY ==============
+
+def test_summary_only_text_formats():
+    write = lambda **kw: Q2.print_mst_result(EDGES[:2], 16, **kw)
+
+    table = text_report(write, "table", summary_only=True)
+    assert "TOTAL MINIMUM COST: $16" in table
+    assert "From" not in table
+
+    output = text_report(write, "csv", summary_only=True)
+    assert output == "field,value\ntotal_cost,16\nroutes_built,2\n"
+
+    jsonl = text_report(write, "jsonl", summary_only=True)
+    assert jsonl == '{"summary":{"total_cost":16,"routes_built":2}}\n'
+
+
+def test_full_csv_keeps_summary():
+    mst_edges, total_cost = Q2.kruskal_mst(4, EDGES)
+    output = text_report(lambda **kw: Q2.print_mst_result(mst_edges, total_cost, **kw), "csv")
+    summary, header, rows = report.read_csv_report(io.StringIO(output))
+    assert summary == [("total_cost", "12.5"), ("routes_built", "3"),
+                       ("rows_written", "3"), ("rows_skipped", "0")]
+    assert len(rows) == 3
+
+    summary, _, _ = report.read_csv_report(io.StringIO(text_report(schedule_writer(), "csv")))
+    assert summary[:2] == [("title", "GREEDY"), ("total_profit", "2950")]
+
+
+def test_summary_only_binary():
+    result, rows = binary_report(lambda **kw: Q3.print_seminars(Q3.seminars_1, **kw),
+                                 summary_only=True)
+    assert rows == []
+    assert result.summary == [("seminars", 8), ("total_possible_profit", 2950)]
+
+
+# ============== FORMAT CONSISTENCY ==============
+
+def test_schedule_rows_match_across_formats():
+    write = schedule_writer()
+    table = text_report(write, "table", limit=2)
+    _, _, csv_rows = report.read_csv_report(io.StringIO(text_report(write, "csv", limit=2)))
+    _, rows = binary_report(write, limit=2)
+
+    assert "S1 " in table and "S7 " in table
+    assert [row[0] for row in csv_rows] == ["1", "7"]
+    assert [row[0] for row in rows] == [1, 7]
+
+
+def test_default_table_output():
+    output = io.StringIO()
+    with redirect_stdout(output):
+        Q2.print_graph(4, EDGES[:1])
+    assert output.getvalue().splitlines()[-3:] == [
+        "From       To         Cost      ",
+        "------------------------------",
+        "0          1          $10        ",
+    ]
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        Q2.print_graph(4, EDGES, out=io.StringIO(), fmt="xml")
+
+
+def test_stream_type_is_checked():
+    with pytest.raises(ValueError):
+        Q2.print_graph(4, EDGES, out=io.StringIO(), fmt="binary")
+    with pytest.raises(ValueError):
+        Q2.print_graph(4, EDGES, out=io.BytesIO(), fmt="csv")
+    # Standard output replaced by a text-only stream has no binary buffer
+    with redirect_stdout(io.StringIO()), pytest.raises(ValueError):
+        Q2.print_graph(4, EDGES, fmt="binary")
+
+
+def test_invalid_limit_is_rejected():
+    for fmt in report.FORMATS:
+        out = io.BytesIO() if fmt == "binary" else io.StringIO()
+        with pytest.raises(ValueError):
+            Q2.print_graph(4, EDGES, out=out, fmt=fmt, limit=-1)
+        # Nothing is written before the check fails
+        assert not out.getvalue()
+
+
+def test_table_without_row_format_is_rejected():
+    with pytest.raises(ValueError):
+        report.write_rows(io.StringIO(), EDGES, Q2.EDGE_COLUMNS)